@@ -83,19 +83,21 @@ class AnalysisModule:
         # For parameters that are present on the parameter_list with a default
         # value and that are not in the parameters dictionary, we add them
         # with their default value.
-        for key in self.parameter_list:
-            if (key not in parameters) and (
-                    self.parameter_list[key][2] is not None):
-                parameters[key] = self.parameter_list[key][2]
+        for key, (_, _, default) in self.parameter_list.items():
+            if (key not in parameters) and (default is not None):
+                parameters[key] = default
 
         # If the keys of the parameters dictionary are different from the one
         # of the parameter_list dictionary, we raises a KeyError. That means
         # that a parameter is missing (and has no default value) or that an
-        # unexpected one was given.
-        if not set(parameters) == set(self.parameter_list):
-            missing_parameters = (set(self.parameter_list) - set(parameters))
-            unexpected_parameters = (set(parameters) -
-                                     set(self.parameter_list))
+        # unexpected one was given. The comparison is done directly on the
+        # dictionary keys view, so neither dictionary is first converted to a
+        # set. The ^ and - operators still build their results as new sets.
+        expected = self.parameter_list.keys()
+        if expected ^ parameters:
+            missing_parameters = expected - parameters
+            unexpected_parameters = [key for key in parameters
+                                     if key not in expected]
             message = ""
             if missing_parameters:
                 message += ("Missing parameters: " +
@@ -10,15 +10,18 @@ The data file is used only to get the list of fluxes to be computed.
 
 """
 
+from itertools import repeat
 import multiprocessing as mp
 
 from .. import AnalysisModule
 from pcigale.utils.counter import Counter
+from pcigale.utils.parallel import unpack_worker
 from .workers import init_fluxes as init_worker_fluxes
 from .workers import fluxes as worker_fluxes
 from ...managers.models import ModelsManager
 from ...managers.observations import ObservationsManager
-from ...managers.parameters import ParametersManager
+from ...managers.parameters import ParametersManager, ParametersManagerGrid
+from ...warehouse import SedWarehouse
 from pcigale.utils.console import console, INFO
 
 
@@ -68,14 +71,36 @@ class SaveFluxes(AnalysisModule):
                     progress = counter.progress
                     counter.progress = None
 
+            # The models are sent to the workers by chunks that are processed
+            # as soon as a worker is available. Small chunks improve the load
+            # balancing, in particular at the end of the computation, whereas
+            # large chunks reduce the communication overhead and make a better
+            # use of the cache of partially computed SED. The results are
+            # stored in shared arrays so there is nothing to collect.
+            chunksize = max(1, len(items) // (ncores * 16))
+            args = zip(repeat(worker), range(len(items)), items)
             with mp.Pool(processes=ncores, initializer=initializer,
                          initargs=initargs) as pool:
-                pool.starmap(worker, enumerate(items))
+                for _ in pool.imap_unordered(unpack_worker, args, chunksize):
+                    pass
 
             # After the parallel processes have exited, it can be restored
             counter.progress = progress
 
     def _compute_models(self, conf, obs, params):
+        # When the processes are forked, the modules instantiated in the parent
+        # process are shared with the workers through copy-on-write. Rather
+        # than having each worker load its own copy of the data (e.g. the
+        # SSP), we load all the modules of the grid once before starting the
+        # workers. This is not done when spawning the processes as the
+        # warehouse would have to be pickled and sent to each worker.
+        if (conf['cores'] > 1 and mp.get_start_method() == 'fork' and
+                isinstance(params, ParametersManagerGrid)):
+            warehouse = SedWarehouse()
+            warehouse.preload_modules(params.modules, params.parameters)
+        else:
+            warehouse = None
+
         nblocks = len(params.blocks)
         for iblock in range(nblocks):
             console.rule(f"Block {iblock + 1}/{nblocks}")
@@ -84,7 +109,7 @@ class SaveFluxes(AnalysisModule):
             models = ModelsManager(conf, obs, params, iblock)
             counter = Counter(len(params.blocks[iblock]), 50, "Model")
 
-            initargs = (models, counter)
+            initargs = (models, counter, warehouse)
             self._parallel_job(worker_fluxes, params.blocks[iblock], initargs,
                                init_worker_fluxes, conf['cores'])
 
@@ -4,7 +4,7 @@ from pathlib import Path
 from ...warehouse import SedWarehouse
 
 
-def init_fluxes(models, counter):
+def init_fluxes(models, counter, warehouse=None):
     """Initializer of the pool of processes. It is mostly used to convert
     RawArrays into numpy arrays. The latter are defined as global variables to
     be accessible from the workers.
@@ -15,11 +15,17 @@ def init_fluxes(models, counter):
         Manages the storage of the computed models (fluxes and properties).
     counter: Counter class object
         Counter for the number of models computed
+    warehouse: SedWarehouse
+        Warehouse with the modules already loaded by the parent process. If
+        None, a new warehouse is created.
 
     """
     global gbl_warehouse, gbl_models, gbl_obs, gbl_save, gbl_counter
 
-    gbl_warehouse = SedWarehouse()
+    if warehouse is None:
+        gbl_warehouse = SedWarehouse()
+    else:
+        gbl_warehouse = warehouse
 
     gbl_models = models
     gbl_obs = models.obs
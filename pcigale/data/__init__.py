@@ -2,7 +2,6 @@
 
 from pathlib import Path
 import pickle
-import traceback
 
 import pkg_resources
 
@@ -44,6 +43,11 @@ class SimpleDatabase:
     a SimpleDatabase is much easier to handle than an SqlAlchemy database.
     """
 
+    # The databases are opened every time a module is instantiated. To avoid
+    # loading the parameters dictionary of a read-only database each time, we
+    # share it between the objects opening the same database.
+    cache_parameters = {}
+
     def __init__(self, name, writable=False):
         """Prepare the database. Each database is stored in a directory of the
         same name and each entry is a pickle file. We store a specific pickle
@@ -73,22 +77,39 @@ class SimpleDatabase:
 
         # We load the parameters dictionary. If this fails it is likely that
         # something went wrong and it needs to be rebuilt.
-        try:
-            with open(self.path / "parameters.pickle", "rb") as f:
-                self.parameters = pickle.load(f)
-        except Exception:
-            raise Exception(
-                f"The database {self.name} appears corrupted. "
-                f"Erase {self.path} and rebuild it."
-            )
+        if writable is False and name in SimpleDatabase.cache_parameters:
+            self.parameters = SimpleDatabase.cache_parameters[name]
+        else:
+            try:
+                with open(self.path / "parameters.pickle", "rb") as f:
+                    self.parameters = pickle.load(f)
+            except Exception:
+                raise Exception(
+                    f"The database {self.name} appears corrupted. "
+                    f"Erase {self.path} and rebuild it."
+                )
+            if writable is False:
+                SimpleDatabase.cache_parameters[name] = self.parameters
+
+        # While the database is writable, the values of each parameter are
+        # kept in sets so that they are deduplicated as they are added.
+        if writable:
+            self.parameters = {k: set(v) for k, v in self.parameters.items()}
+
+        # The names of the primary keys are the same for all the entries. We
+        # build the template of the file names from them once and for all. If
+        # the database is empty, this is done when adding the first entry.
+        if self.parameters:
+            self._set_basename_template(self.parameters)
+        else:
+            self._basename_template = None
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, tb):
-        if exc_type is not None:
-            traceback.print_exception(exc_type, exc_value, tb)
-
+        # Any exception propagates once the database is closed, so there is no
+        # need to print it here.
         self.close()
 
     def close(self):
@@ -96,12 +117,15 @@ class SimpleDatabase:
         was writable.
         """
         if self.writable:
-            # Eliminate duplicated parameter values and we save the dictionary.
-            for k, v in self.parameters.items():
-                self.parameters[k] = list(set(v))
-
+            # We save the dictionary with the parameter values as lists. They
+            # are sorted once and for all here so that users of the database
+            # do not need to sort them each time they are read.
+            parameters = {k: sorted(v) for k, v in self.parameters.items()}
             with open(self.path / "parameters.pickle", "wb") as f:
-                pickle.dump(self.parameters, f)
+                pickle.dump(parameters, f)
+
+            # The parameters may have changed, so the shared copy is outdated.
+            SimpleDatabase.cache_parameters.pop(self.name, None)
 
     def add(self, primarykeys, data):
         """Add an entry to the database. The primary keys and the data are used
@@ -119,18 +143,20 @@ class SimpleDatabase:
         if self.writable is False:
             raise Exception(f"The database {self.name} is read-only.")
 
+        if self._basename_template is None:
+            self._set_basename_template(primarykeys)
+
         entry = SimpleDatabaseEntry(primarykeys, data)
-        basename = "_".join(f"{k}={v}" for k, v in sorted(primarykeys.items()))
+        basename = self._basename(primarykeys)
 
-        with open(self.path / Path(f"{basename}.pickle"), "wb") as f:
-            pickle.dump(entry, f)
+        # The highest protocol serialises the numpy arrays of the entry as raw
+        # buffers, which is faster than the default protocol when building the
+        # database.
+        with open(self.path / f"{basename}.pickle", "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
 
-        if len(self.parameters) == 0:  # Create the initial lists
-            for k, v in primarykeys.items():
-                self.parameters[k] = [v]
-        else:
-            for k, v in primarykeys.items():
-                self.parameters[k].append(v)
+        for k, v in primarykeys.items():
+            self.parameters.setdefault(k, set()).add(v)
 
     def get(self, **primarykeys):
         """Get an entry from the database. This is done by loading a pickle file
@@ -149,10 +175,9 @@ class SimpleDatabase:
             Object containing the primary keys (e.g., metallicity, etc.) and the
             data (e.g., wavelength, spectrum, etc.).
         """
-        basename = "_".join(f"{k}={v}" for k, v in sorted(primarykeys.items()))
-
         try:
-            with open(self.path / Path(f"{basename}.pickle"), "rb") as f:
+            basename = self._basename(primarykeys)
+            with open(self.path / f"{basename}.pickle", "rb") as f:
                 entry = pickle.load(f)
         except Exception:
             raise Exception(
@@ -162,3 +187,36 @@ class SimpleDatabase:
             )
 
         return entry
+
+    def _set_basename_template(self, keys):
+        """Build the template of the file names of the entries. Each name is
+        made of the names and values of the primary keys, sorted by name.
+
+        Parameters
+        ----------
+        keys: iterable
+            Names of the primary keys
+        """
+        keys = sorted(keys)
+        self._basename_template = "_".join(f"{k}={{{k}}}" for k in keys)
+        self._nkeys = len(keys)
+
+    def _basename(self, primarykeys):
+        """Build the name of the file of an entry, without the extension, from
+        the values of its primary keys.
+
+        Parameters
+        ----------
+        primarykeys: dict
+            Dictionary containing the primary keys (e.g., metallicity, etc.)
+
+        Returns
+        -------
+        basename: str
+            Name of the file of the entry.
+        """
+        if len(primarykeys) != self._nkeys:
+            raise KeyError(f"The database {self.name} expects "
+                           f"{self._nkeys} primary keys.")
+
+        return self._basename_template.format(**primarykeys)
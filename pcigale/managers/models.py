@@ -67,21 +67,25 @@ class ModelsManager:
             Root of the filename where to save the data.
 
         """
-        table = Table()
-        table.add_column(Column(self.block, name='id'))
+        # The columns are built from the numpy views of the shared arrays
+        # rather than the SharedArray objects themselves to avoid an
+        # element-by-element conversion. The table is then created at once
+        # rather than adding the columns one by one.
+        columns = [Column(self.block, name='id')]
         for band in sorted(self.flux.keys()):
             if band.startswith('line.') or band.startswith('linefilter.'):
                 unit = 'W/m^2'
             else:
                 unit = 'mJy'
-            table.add_column(Column(self.flux[band], name=band,
-                                    unit=Unit(unit)))
+            columns.append(Column(self.flux[band].array, name=band,
+                                  unit=Unit(unit)))
         for prop in sorted(self.extprop.keys()):
-            table.add_column(Column(self.extprop[prop], name=prop,
-                                    unit=Unit(self.unit[prop])))
+            columns.append(Column(self.extprop[prop].array, name=prop,
+                                  unit=Unit(self.unit[prop])))
         for prop in sorted(self.intprop.keys()):
-            table.add_column(Column(self.intprop[prop], name=prop,
-                                    unit=Unit(self.unit[prop])))
+            columns.append(Column(self.intprop[prop].array, name=prop,
+                                  unit=Unit(self.unit[prop])))
+        table = Table(columns, copy=False)
 
         out = Path('out')
         table.write(out / f"{filename}.fits")
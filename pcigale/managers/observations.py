@@ -147,22 +147,30 @@ class ObservationsManagerPassbands:
         if defaulterror < 0.:
             raise ValueError("The relative default error must be positive.")
 
+        # Rather than adding the missing error columns one by one, which
+        # rebuilds the table each time, we collect them and add them all at
+        # once after their respective quantities.
+        colnames = set(self.table.colnames)
+        tofit_err = set(self.tofit_err)
+        columns = []
+        indexes = []
         for item in self.tofit:
             error = item + '_err'
             if item in self.intprops:
-                if (error not in self.intprops_err or
-                        error not in self.table.colnames):
+                if error not in self.intprops_err or error not in colnames:
                     raise ValueError("Intensive properties errors must be in "
                                      "input file.")
-            elif (error not in self.tofit_err or
-                  error not in self.table.colnames):
-                colerr = Column(data=np.fabs(self.table[item] * defaulterror),
-                                name=error)
-                self.table.add_column(colerr,
-                                      index=self.table.colnames.index(item) + 1)
+            elif error not in tofit_err or error not in colnames:
+                columns.append(Column(data=np.fabs(self.table[item] *
+                                                   defaulterror),
+                                      name=error))
+                indexes.append(self.table.colnames.index(item) + 1)
                 console.print(f"{WARNING} {defaulterror * 100}% of {item} "
                               "taken as errors.")
 
+        if columns:
+            self.table.add_columns(columns, indexes=indexes)
+
     def _check_invalid(self, upperlimits="none", threshold=-9990.):
         """Check whether invalid data are correctly marked as such.
 
@@ -219,11 +227,27 @@ class ObservationsManagerPassbands:
         if modelerror < 0.:
             raise ValueError("The relative model error must be positive.")
 
-        for item in self.bands + self.extprops:
-            error = item + '_err'
-            w = np.where(self.table[error] >= 0.)
-            self.table[error][w] = np.sqrt(self.table[error][w]**2. + (
-                self.table[item][w] * modelerror)**2.)
+        # Rather than processing each band or property one after the other, we
+        # stack them all into 2D arrays so the error is computed for all of
+        # them in one vectorised operation. np.hypot does the quadratic sum in
+        # a single pass without intermediate squared arrays. The stacked
+        # arrays only contain the data of the columns, so we keep track of the
+        # masked values and errors separately. Only the errors that are
+        # neither masked nor negative are updated and written back, so the
+        # other ones keep their value and their mask.
+        items = self.bands + self.extprops
+        value = np.array([self.table[item] for item in items], dtype=float)
+        error = np.array([self.table[item + '_err'] for item in items],
+                         dtype=float)
+        masked = np.array([np.ma.getmaskarray(self.table[item]) |
+                           np.ma.getmaskarray(self.table[item + '_err'])
+                           for item in items], dtype=bool)
+        valid = ~masked & (error >= 0.)
+        value *= modelerror
+        np.hypot(error, value, out=error, where=valid)
+
+        for item, item_error, item_valid in zip(items, error, valid):
+            self.table[item + '_err'][item_valid] = item_error[item_valid]
 
     def generate_mock(self, fits):
         """Replaces the actual observations with a mock catalogue. It is
@@ -165,7 +165,7 @@ class ParametersManagerFile:
             for colname in table.colnames:
                 if colname.startswith(module):
                     parname = colname.split('.', 1)[1]
-                    if type(table[colname][0]) is np.str_:
+                    if isinstance(table[colname][0], np.str_):
                         dict_params[parname] = [str(val) for val in
                                                 table[colname]]
                     else:
@@ -208,9 +208,11 @@ class ParametersManagerFile:
 
         """
 
-        # As we have a simple file, this corresponds to the line number
-        params = [{name: self.parameters[idx_module][name][index] for name in
-                   self.parameters[idx_module]} for idx_module, module
-                  in enumerate(self.modules)]
+        # As we have a simple file, this corresponds to the line number. We
+        # iterate directly over the parameters of each module rather than
+        # looking up each module and each parameter by their name as this is
+        # called for every single model.
+        params = [{name: values[index] for name, values in module.items()}
+                  for module in self.parameters]
 
         return params
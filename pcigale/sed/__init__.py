@@ -24,8 +24,6 @@ from numpy.core.multiarray import interp  # Compiled version
 from scipy.constants import parsec
 
 from . import utils
-from .io.vo import save_sed_to_vo
-from .io.fits import save_sed_to_fits
 from ..data import SimpleDatabase as Database
 
 
@@ -37,6 +35,11 @@ class SED:
     # shared between different objects.
     cache_filters = {}
 
+    # Similarly, the filters database is opened only once and shared between
+    # the objects rather than being opened again each time a new filter is
+    # needed.
+    filters_db = None
+
     def __init__(self, sfh=None):
         """Create a new SED
 
@@ -141,6 +144,43 @@ class SED:
             raise KeyError("The information %s is already present "
                            "in the SED. " % key)
 
+    def add_info_many(self, keys, values, mass_proportional=False,
+                      force=False, unit=''):
+        """
+        Add several keys / values sharing the same properties to the
+        information dictionary
+
+        This is equivalent to calling add_info for each key / value pair but
+        the dictionaries are updated at once, which is faster when many
+        related quantities are added for each SED.
+
+        Parameters
+        ----------
+        keys: sequence of immutables
+           The keys used to retrieve the information.
+        values: sequence
+           The information, in the same order as the keys.
+        mass_proportional: boolean
+           If True, the added variables are set as proportional to the
+           mass.
+        force: boolean
+           If false (default), adding a key that already exists in the info
+           dictionary will raise an error. If true, doing this will update
+           the associated value.
+        unit: string
+           Unit common to all the added variables.
+
+        """
+        if not force:
+            present = self.info.keys() & keys
+            if len(present) > 0:
+                raise KeyError("The information %s is already present "
+                               "in the SED. " % ", ".join(sorted(present)))
+        self.info.update(zip(keys, values))
+        self.unit.update(dict.fromkeys(keys, unit))
+        if mass_proportional:
+            self.mass_proportional_info.update(keys)
+
     def add_module(self, module_name, module_conf):
         """Add a new module information to the SED.
 
@@ -270,8 +310,9 @@ class SED:
         if key in self.cache_filters:
             wavelength_r, transmission_r, lambda_piv = self.cache_filters[key]
         else:
-            with Database("filters") as db:
-                filter_ = db.get(name=filter_name)
+            if SED.filters_db is None:
+                SED.filters_db = Database("filters")
+            filter_ = SED.filters_db.get(name=filter_name)
             wl = filter_.wl
             tr = filter_.tr
             lambda_piv = filter_.pivot
@@ -330,6 +371,10 @@ class SED:
             multiplied by this mass.
 
         """
+        # The VO-table writer relies on astropy, which is slow to import, so
+        # we only import it when an SED is actually saved.
+        from .io.vo import save_sed_to_vo
+
         save_sed_to_vo(self, filename, mass)
 
     def to_fits(self, prefix, mass=1.):
@@ -345,6 +390,9 @@ class SED:
             to this mass
 
         """
+        # Same as for to_votable(), we defer the import of the FITS writer.
+        from .io.fits import save_sed_to_fits
+
         save_sed_to_fits(self, prefix, mass)
 
     def copy(self):
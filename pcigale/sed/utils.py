@@ -408,6 +408,32 @@ def flux_trapz(y, x, key):
     return np.dot(dx, y[1:] + y[:-1]) * .5
 
 
+def trapz_weights(x):
+    """
+    Compute the weights of the trapezoidal rule for a given sampling. The
+    integral of any y array sampled on x is then simply np.dot(y, weights).
+    This is useful when many arrays have to be integrated on the same sampling
+    as each integration then reduces to a single dot product without any
+    temporary array.
+
+    Parameters
+    ----------
+    x: 1D array
+        Sampling of the arrays to integrate, typically wavelengths
+
+    Returns
+    -------
+    weights: 1D array
+        Weights of the trapezoidal rule for each element of x
+    """
+    weights = np.zeros(x.size)
+    dx = np.diff(x) * .5
+    weights[:-1] += dx
+    weights[1:] += dx
+
+    return weights
+
+
 def quick_interp_lum(x_new, x, y):
     """
     Light weight interpolation function to interpolate luminosities on a new
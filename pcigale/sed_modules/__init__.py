@@ -1,3 +1,4 @@
+from functools import lru_cache
 from importlib import import_module
 import inspect
 import os
@@ -30,16 +31,27 @@ def complete_parameters(given_parameters, parameter_list):
     KeyError when the given parameters are different from the expected ones.
 
     """
-    # Complete the given parameters with default values when needed.
-    for key in parameter_list:
-        if (key not in given_parameters) and (
-                parameter_list[key][2] is not None):
-            given_parameters[key] = parameter_list[key][2]
+    # Complete the given parameters with default values when needed and order
+    # the result as the parameter_list of the module is. This is done in a
+    # single pass, counting the given parameters that are expected so that
+    # the unexpected ones only need to be identified when there is an error.
+    result = dict()
+    missing_parameters = []
+    nexpected = 0
+    for key, (_, _, default) in parameter_list.items():
+        if key in given_parameters:
+            result[key] = given_parameters[key]
+            nexpected += 1
+        elif default is not None:
+            result[key] = default
+        else:
+            missing_parameters.append(key)
+
     # Check parameter consistency between the parameter list and the given
     # parameters.
-    if not set(given_parameters) == set(parameter_list):
-        missing_parameters = (set(parameter_list) - set(given_parameters))
-        unexpected_parameters = (set(given_parameters) - set(parameter_list))
+    if missing_parameters or nexpected != len(given_parameters):
+        unexpected_parameters = [key for key in given_parameters
+                                 if key not in parameter_list]
         message = ""
         if missing_parameters:
             message += ("Missing parameters: " +
@@ -52,11 +64,6 @@ def complete_parameters(given_parameters, parameter_list):
         raise KeyError("The parameters passed are different from the "
                        "expected one. " + message)
 
-    # We want the result to be ordered as the parameter_list of the module is.
-    result = dict()
-    for key in parameter_list:
-        result[key] = given_parameters[key]
-
     return result
 
 
@@ -160,7 +167,27 @@ def get_module(name, **kwargs):
     """
 
     try:
-        module = import_module("." + name, 'pcigale.sed_modules')
-        return module.Module(name=name, **kwargs)
+        module = _load_module(name.split('.')[0])
     except ImportError:
         raise Exception(f"Module {name} could not be imported.")
+
+    return module.Module(name=name, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _load_module(name):
+    """Import a SED creation module from its name. As get_module() is called
+    for each set of parameters, the result is cached so that the import
+    machinery is only invoked once per module.
+
+    Parameters
+    ----------
+    name: string
+        The name of the module to import, without any prefix.
+
+    Returns
+    -------
+    a python module
+
+    """
+    return import_module("." + name, 'pcigale.sed_modules')
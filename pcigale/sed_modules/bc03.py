@@ -11,6 +11,7 @@ import numpy as np
 
 from . import SedModule
 from ..data import SimpleDatabase as Database
+from ..sed.utils import trapz_weights
 
 __category__ = "SSP"
 
@@ -86,25 +87,31 @@ class BC03(SedModule):
         # The convolution is just a matter of reverting the SFH and computing
         # the sum of the data from the SSP one to one product. This is done
         # using the dot product. The 1e6 factor is because the SFH is in solar
-        # mass per year.
-        info_young = 1e6 * np.dot(info[:, :self.separation_age],
-                                  sfh[-self.separation_age:][::-1])
-        spec_young = 1e6 * np.dot(spec[:, :self.separation_age],
-                                  sfh[-self.separation_age:][::-1])
+        # mass per year. The SFH is reverted only once, the young and old parts
+        # being views of the reverted array.
+        sfh_rev = sfh[::-1]
+        sfh_young = sfh_rev[:self.separation_age]
+        sfh_old = sfh_rev[self.separation_age:]
 
-        info_old = 1e6 * np.dot(info[:, self.separation_age:],
-                                sfh[:-self.separation_age][::-1])
-        spec_old = 1e6 * np.dot(spec[:, self.separation_age:],
-                                sfh[:-self.separation_age][::-1])
+        info_young = 1e6 * np.dot(info[:, :self.separation_age], sfh_young)
+        spec_young = 1e6 * np.dot(spec[:, :self.separation_age], sfh_young)
+
+        info_old = 1e6 * np.dot(info[:, self.separation_age:], sfh_old)
+        spec_old = 1e6 * np.dot(spec[:, self.separation_age:], sfh_old)
 
         info_all = info_young + info_old
 
+        # The stellar mass-weighted age is the ratio of the convolution of the
+        # age×stellar mass product with the SFH to the total stellar mass.
+        # The product is precomputed so this is just another dot product.
+        age_mass = (1e6 * np.dot(self.t_m_star[:sfh.size], sfh_rev) /
+                    info_all[0])
+
         info_young = dict(zip(["m_star", "m_gas", "n_ly"], info_young))
         info_old = dict(zip(["m_star", "m_gas", "n_ly"], info_old))
         info_all = dict(zip(["m_star", "m_gas", "n_ly"], info_all))
 
-        info_all['age_mass'] = np.average(self.ssp.t[:sfh.size],
-                                          weights=info[0, :] * sfh[::-1])
+        info_all['age_mass'] = age_mass
 
         return spec_young, spec_old, info_young, info_old, info_all
 
@@ -122,6 +129,20 @@ class BC03(SedModule):
             else:
                 raise Exception(f"IMF #{self.imf} unknown")
 
+        # Product of the age and the stellar mass of the SSP to compute the
+        # stellar mass-weighted age with a single dot product.
+        self.t_m_star = self.ssp.t * self.ssp.info[0, :]
+
+        # The luminosities are always integrated on the same wavelength grid,
+        # either over the Lyman continuum or over the entire spectrum. We
+        # precompute the weights of the trapezoidal rule for both so that the
+        # two integrals of a spectrum are obtained with a single dot product.
+        wave = self.ssp.wl
+        n_lyc = np.count_nonzero(wave <= 91.1)
+        self.lum_weights = np.zeros((wave.size, 2))
+        self.lum_weights[:n_lyc, 0] = trapz_weights(wave[:n_lyc])
+        self.lum_weights[:, 1] = trapz_weights(wave)
+
     def process(self, sed):
         """Add the convolution of a Bruzual and Charlot SSP to the SED
 
@@ -135,14 +156,11 @@ class BC03(SedModule):
         spec_young, spec_old, info_young, info_old, info_all = out
 
         # We compute the Lyman continuum luminosity as it is important to
-        # compute the energy absorbed by the dust before ionising gas.
+        # compute the energy absorbed by the dust before ionising gas. We do
+        # similarly for the total stellar luminosity.
         wave = self.ssp.wl
-        w = np.where(wave <= 91.1)
-        lum_lyc_young, lum_lyc_old = np.trapz([spec_young[w], spec_old[w]],
-                                              wave[w])
-
-        # We do similarly for the total stellar luminosity
-        lum_young, lum_old = np.trapz([spec_young, spec_old], wave)
+        lum_lyc_young, lum_young = np.dot(spec_young, self.lum_weights)
+        lum_lyc_old, lum_old = np.dot(spec_old, self.lum_weights)
 
         sed.add_module(self.name, self.parameters)
 
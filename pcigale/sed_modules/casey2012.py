@@ -13,6 +13,19 @@ from . import SedModule
 
 __category__ = "dust emission"
 
+# The wavelength grid does not depend on the parameters of the model. To avoid
+# recomputing it and the quantities that depend only on it for each set of
+# parameters, we compute them once when the module is imported. For
+# consistency, we define the speed of light in nm s¯¹ rather than in m s¯¹.
+c = cst.c * 1e9
+h_over_k = cst.h / cst.k
+lambda_0 = 200e3
+wave = np.logspace(3., 6., 1000)
+nu = c / wave
+conv = nu / wave
+conv_nu3 = conv * nu ** 3.
+lambda_0_over_wave = lambda_0 / wave
+
 
 class Casey2012(SedModule):
     """Casey (2012) templates IR re-emission
@@ -49,34 +62,33 @@ class Casey2012(SedModule):
         beta = float(self.parameters["beta"])
         alpha = float(self.parameters["alpha"])
 
-        # We define various constants necessary to compute the model. For
-        # consistency, we define the speed of light in nm s¯¹ rather than in
-        # m s¯¹.
-        c = cst.c * 1e9
+        # We define various constants necessary to compute the model.
         b1 = 26.68
         b2 = 6.246
         b3 = 1.905e-4
         b4 = 7.243e-5
         lambda_c = 0.75e3 / ((b1 + b2 * alpha) ** -2. + (b3 + b4 * alpha) * T)
-        lambda_0 = 200e3
         Npl = ((1. - np.exp(-(lambda_0 / lambda_c) ** beta)) * (c / lambda_c)
                ** 3. / (np.exp(cst.h * c / (lambda_c * cst.k * T)) - 1.))
 
-        self.wave = np.logspace(3., 6., 1000)
-        conv = c / (self.wave * self.wave)
+        self.wave = wave
+
+        # To limit the number of temporary arrays, the reduced wavelength is
+        # computed only once. We also rely on expm1, which computes exp(x)-1 in
+        # a single pass and is more accurate for small x.
+        x = wave / lambda_c
 
-        self.lumin_blackbody = (conv * (1. - np.exp(-(lambda_0 / self.wave)
-                                ** beta)) * (c / self.wave) ** 3. / (np.exp(
-                                    cst.h * c / (self.wave * cst.k * T)) - 1.))
-        self.lumin_powerlaw = (conv * Npl * (self.wave / lambda_c) ** alpha *
-                               np.exp(-(self.wave / lambda_c) ** 2.))
+        self.lumin_blackbody = (-np.expm1(-lambda_0_over_wave ** beta) *
+                                conv_nu3 / np.expm1((h_over_k / T) * nu))
+        self.lumin_powerlaw = conv * Npl * x ** alpha * np.exp(-x * x)
 
         # TODO, save the right normalisation factor to retrieve the dust mass
-        norm = np.trapz(self.lumin_powerlaw + self.lumin_blackbody,
-                        x=self.wave)
-        self.lumin_powerlaw /= norm
-        self.lumin_blackbody /= norm
-        self.lumin = self.lumin_powerlaw + self.lumin_blackbody
+        # The total template is not kept as only the two components are added
+        # to the SED. This reduces the memory footprint of each instance.
+        norm = 1. / np.trapz(self.lumin_powerlaw + self.lumin_blackbody,
+                             x=wave)
+        self.lumin_powerlaw *= norm
+        self.lumin_blackbody *= norm
 
         self.temperature = T
         self.beta = beta
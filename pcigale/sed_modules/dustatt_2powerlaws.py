@@ -22,30 +22,13 @@ Parameters available for analysis
 import numpy as np
 
 from . import SedModule
+from ..sed.utils import trapz_weights
 
 __category__ = "dust attenuation"
 
 
-def power_law(wavelength, delta):
-    """Compute the power law (λ / λv)^δ
-
-    Parameters
-    ----------
-    wavelength: array of float
-        Wavelength grid in nm.
-    delta: float
-        Power law slope.
-
-    Returns
-    -------
-    a numpy array of floats
-
-    """
-    wave = np.array(wavelength)
-    return (wave / 550) ** delta
-
-
-def alambda_av(wavelengths, delta, delta_sec=None, factor=None):
+def alambda_av(wavelengths, delta, delta_sec=None, factor=None,
+               log_wave=None):
     """Compute the complete attenuation curve A(λ)/Av
 
     The attenuation curve is a power law (λ / λv) ** δ. If a factor and
@@ -67,6 +50,10 @@ def alambda_av(wavelengths, delta, delta_sec=None, factor=None):
     factor: float
         Factor by which the secondary power law is multiplied before being
         added to the main one.
+    log_wave: array of floats
+        Natural logarithm of wavelengths / 550. If not given, it is computed
+        from the wavelengths. It can be passed to avoid recomputing it when
+        evaluating several curves on the same grid.
 
     Returns
     -------
@@ -74,12 +61,18 @@ def alambda_av(wavelengths, delta, delta_sec=None, factor=None):
         The A(λ)/Av attenuation at each wavelength of the grid.
 
     """
-    wave = np.array(wavelengths)
+    wave = np.asarray(wavelengths)
+
+    # Raising to a non-integer power is slow. As all the power laws are
+    # evaluated on the same grid, we compute the logarithm of the reduced
+    # wavelength only once and exponentiate it for each slope instead.
+    if log_wave is None:
+        log_wave = np.log(wave / 550.)
 
-    attenuation = power_law(wave, delta)
+    attenuation = np.exp(delta * log_wave)
 
     if factor:
-        attenuation += factor * power_law(wave, delta_sec)
+        attenuation += factor * np.exp(delta_sec * log_wave)
 
     # Lyman continuum not attenuated.
     attenuation[wave <= 91.2] = 0.
@@ -135,11 +128,13 @@ class TwoPowerLawAtt(SedModule):
         self.slope_ISM = float(self.parameters['slope_ISM'])
         self.filter_list = [item.strip() for item in
                             self.parameters["filters"].split("&")]
+        self.filter_keys = [f"attenuation.{filt}" for filt in self.filter_list]
         self.Av_ISM = self.Av_BC / self.BC_to_ISM_factor
         # We cannot compute the attenuation until we know the wavelengths. Yet,
         # we reserve the object.
         self.contatt = {}
         self.lineatt = {}
+        self.lumin_weights = {}
 
     def process(self, sed):
         """Add the dust attenuation to the SED.
@@ -152,29 +147,63 @@ class TwoPowerLawAtt(SedModule):
 
         wl = sed.wavelength_grid
 
-        # Compute the attenuation curves on the continuum wavelength grid
-        if len(self.contatt) == 0:
-            self.contatt['old'] = 10. ** (-.4 * alambda_av(wl, self.slope_ISM) *
-                                          self.Av_ISM)
+        # Compute the attenuation curves on the continuum wavelength grid. The
+        # grid is the same for all the SED processed by the module, except
+        # that it depends on the width of the lines. So the curves are cached
+        # with the same key as the filters in SED.compute_fnu(). As the curves
+        # are only used to compute the attenuated luminosity, we directly store
+        # them minus one so that it is not done for each SED.
+        key = (wl.size, sed.info.get('nebular.lines_width'))
+        contatt = self.contatt.get(key)
+        if contatt is None:
+            # The attenuation factors 10^(-0.4 Av A(λ)/Av) are computed as
+            # exponentials. The exponents are computed in place and for the
+            # young population the ISM and birth clouds exponents are summed so
+            # that its curve is obtained with a single exponential rather than
+            # as the product of two. With expm1 we directly get the curves
+            # minus one.
+            log_wl = np.log(wl / 550.)
+            old = alambda_av(wl, self.slope_ISM, log_wave=log_wl)
+            old *= -.4 * np.log(10.) * self.Av_ISM
             # Emission from the young population is attenuated by both
             # components
-            self.contatt['young'] = 10. ** (-.4 * alambda_av(wl, self.slope_BC) *
-                                            self.Av_BC) * self.contatt['old']
+            young = alambda_av(wl, self.slope_BC, log_wave=log_wl)
+            young *= -.4 * np.log(10.) * self.Av_BC
+            young += old
+            contatt = {'old': np.expm1(old, out=old),
+                       'young': np.expm1(young, out=young)}
+            self.contatt[key] = contatt
+
+            # The luminosity absorbed by the dust is integrated on the same
+            # grid as the curves, so we also precompute the weights of the
+            # trapezoidal rule to integrate with a dot product.
+            self.lumin_weights[key] = trapz_weights(wl)
+        weights = self.lumin_weights[key]
 
         # Compute the attenuation curves on the line wavelength grid
         if len(self.lineatt) == 0:
             names = [k for k in sed.lines]
             linewl = np.array([sed.lines[k][0] for k in names])
-            old_curve = 10.**(-.4 * alambda_av(linewl, self.slope_ISM) *
-                              self.Av_ISM)
-            young_curve = 10.**(-.4 * alambda_av(linewl, self.slope_BC) *
-                                self.Av_BC) * old_curve
+            log_linewl = np.log(linewl / 550.)
+            old_curve = alambda_av(linewl, self.slope_ISM,
+                                   log_wave=log_linewl)
+            old_curve *= -.4 * np.log(10.) * self.Av_ISM
+            young_curve = alambda_av(linewl, self.slope_BC,
+                                     log_wave=log_linewl)
+            young_curve *= -.4 * np.log(10.) * self.Av_BC
+            young_curve += old_curve
+            np.exp(old_curve, out=old_curve)
+            np.exp(young_curve, out=young_curve)
 
             for name, old, young in zip(names, old_curve, young_curve):
                 self.lineatt[name] = (old, young)
 
-        # Fλ fluxes in each filter before attenuation.
-        flux_noatt = {filt: sed.compute_fnu(filt) for filt in self.filter_list}
+        # Fλ fluxes in each filter before attenuation. They are stored in an
+        # array so that the attenuations are computed in a single operation.
+        flux_noatt = np.array([sed.compute_fnu(filt)
+                               for filt in self.filter_list])
+
+        sed.add_module(self.name, self.parameters)
 
         dust_lumin = 0.
         contribs = [contrib for contrib in sed.luminosities if
@@ -184,10 +213,9 @@ class TwoPowerLawAtt(SedModule):
             age = contrib.split('.')[-1].split('_')[-1]
             luminosity = sed.luminosities[contrib]
 
-            attenuation_spectrum = luminosity * (self.contatt[age] - 1.)
-            dust_lumin -= np.trapz(attenuation_spectrum, wl)
+            attenuation_spectrum = luminosity * contatt[age]
+            dust_lumin -= np.dot(attenuation_spectrum, weights)
 
-            sed.add_module(self.name, self.parameters)
             sed.add_contribution("attenuation." + contrib, wl,
                                  attenuation_spectrum)
 
@@ -209,13 +237,12 @@ class TwoPowerLawAtt(SedModule):
             sed.add_info("dust.luminosity", dust_lumin, True, unit='W')
 
         # Fλ fluxes (only in continuum) in each filter after attenuation.
-        flux_att = {filt: sed.compute_fnu(filt) for filt in self.filter_list}
+        flux_att = np.array([sed.compute_fnu(filt)
+                             for filt in self.filter_list])
 
         # Attenuation in each filter
-        for filt in self.filter_list:
-            sed.add_info("attenuation." + filt,
-                         -2.5 * np.log10(flux_att[filt] / flux_noatt[filt]),
-                         unit='mag')
+        sed.add_info_many(self.filter_keys,
+                          -2.5 * np.log10(flux_att / flux_noatt), unit='mag')
 
 
 # CreationModule to be returned by get_module
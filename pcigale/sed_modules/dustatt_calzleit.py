@@ -283,6 +283,8 @@ class CalzLeit(SedModule):
             for name, old, young in zip(names, old_curve, young_curve):
                 self.lineatt[name] = (old, young)
 
+        sed.add_module(self.name, self.parameters)
+
         attenuation_total = 0.
         contribs = [contrib for contrib in sed.luminosities if
                     'absorption' not in contrib]
@@ -297,7 +299,6 @@ class CalzLeit(SedModule):
                                        attenuation_spectrum[:-1])
             attenuation_total += attenuation
 
-            sed.add_module(self.name, self.parameters)
             sed.add_info("attenuation.E_BVs." + contrib, self.ebvs[age],
                          unit='mag')
             sed.add_info("attenuation." + contrib, attenuation, True,
@@ -143,6 +143,8 @@ class ModCF00Att(SedModule):
         # Fλ fluxes in each filter before attenuation.
         flux_noatt = {filt: sed.compute_fnu(filt) for filt in self.filter_list}
 
+        sed.add_module(self.name, self.parameters)
+
         dust_lumin = 0.
         contribs = [contrib for contrib in sed.luminosities if
                     'absorption' not in contrib]
@@ -154,7 +156,6 @@ class ModCF00Att(SedModule):
             attenuation_spectrum = luminosity * (self.contatt[age] - 1.)
             dust_lumin -= np.trapz(attenuation_spectrum, wl)
 
-            sed.add_module(self.name, self.parameters)
             sed.add_contribution("attenuation." + contrib, wl,
                                  attenuation_spectrum)
 
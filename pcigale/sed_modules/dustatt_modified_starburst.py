@@ -419,6 +419,8 @@ class ModStarburstAtt(SedModule):
             for k, v in self.lineatt.items():
                 self.lineatt[k] = 10. ** (-.4 * v * self.ebvl)
 
+        sed.add_module(self.name, self.parameters)
+
         dust_lumin = 0.
         contribs = [contrib for contrib in sed.luminosities if
                     'absorption' not in contrib]
@@ -431,7 +433,6 @@ class ModStarburstAtt(SedModule):
                 attenuation_spec = luminosity * (self.contatt - 1.)
             dust_lumin -= np.trapz(attenuation_spec, wl)
 
-            sed.add_module(self.name, self.parameters)
             sed.add_contribution("attenuation." + contrib, wl,
                                  attenuation_spec)
 
@@ -196,6 +196,8 @@ class PowerLawAtt(SedModule):
             for name, old, young in zip(names, old_curve, young_curve):
                 self.lineatt[name] = (old, young)
 
+        sed.add_module(self.name, self.parameters)
+
         dust_lumin = 0.
         contribs = [contrib for contrib in sed.luminosities if
                     'absorption' not in contrib]
@@ -206,7 +208,6 @@ class PowerLawAtt(SedModule):
             attenuation_spectrum = luminosity * (self.contatt[age] - 1.)
             dust_lumin -= np.trapz(attenuation_spectrum, wavelength)
 
-            sed.add_module(self.name, self.parameters)
             sed.add_info("attenuation.Av." + contrib, self.av[age], unit='mag')
             sed.add_contribution("attenuation." + contrib, wavelength,
                                  attenuation_spectrum)
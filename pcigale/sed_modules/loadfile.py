@@ -6,6 +6,8 @@ This module reads a SED spectrum from a file.
 
 """
 
+import numpy as np
+
 from pcigale.utils.io import read_table
 from . import SedModule
 
@@ -34,6 +36,18 @@ class LoadSpecFile(SedModule):
         )
     }
 
+    def _init_code(self):
+        """Read the spectrum from the file. This is done only once rather than
+        for each SED, and the columns are converted to plain arrays so that
+        the SED does not have to deal with astropy columns."""
+        self.filename = self.parameters['filename']
+        table = read_table(self.filename)
+
+        self.wave = np.array(table[self.parameters['lambda_column']],
+                             dtype=float)
+        self.lumin = np.array(table[self.parameters['l_lambda_column']],
+                              dtype=float)
+
     def process(self, sed):
         """Add the spectrum from the file to the SED object
 
@@ -42,16 +56,9 @@ class LoadSpecFile(SedModule):
         sed: pcigale.sed.SED object
 
         """
-        filename = self.parameters['filename']
-        table = read_table(filename)
-
         sed.add_module(self.name, self.parameters)
 
-        sed.add_contribution(
-            filename,
-            table[self.parameters['lambda_column']],
-            table[self.parameters['l_lambda_column']]
-        )
+        sed.add_contribution(self.filename, self.wave, self.lumin)
 
 
 # SedModule to be returned by get_module
@@ -11,9 +11,18 @@ import scipy.constants as cst
 
 from . import SedModule
 from ..data import SimpleDatabase as Database
+from ..sed.utils import trapz_weights
 
 __category__ = "SSP"
 
+# Keys of the stellar masses from the info table of the SSP, in the same order
+# as the table, for the young, old, and entire stellar populations.
+mass_names = ['mass_total', 'mass_alive', 'mass_white_dwarf', 'mass_neutron',
+              'mass_black_hole']
+mass_keys_young = [f'stellar.{name}_young' for name in mass_names]
+mass_keys_old = [f'stellar.{name}_old' for name in mass_names]
+mass_keys_all = [f'stellar.{name}' for name in mass_names]
+
 
 class M2005(SedModule):
     """Maraston (2005) stellar emission module
@@ -83,21 +92,27 @@ class M2005(SedModule):
         # share the same time grid, the convolution is just a matter of
         # reverting one and computing the sum of the one to one product; this
         # is done using the dot product. The 1e6 factor is because the SFH is
-        # in solar mass per year.
-        info_young = 1e6 * np.dot(info[:, :self.separation_age],
-                                  sfh[-self.separation_age:][::-1])
-        spec_young = 1e6 * np.dot(spec[:, :self.separation_age],
-                                  sfh[-self.separation_age:][::-1])
+        # in solar mass per year. The SFH is reverted only once, the young and
+        # old parts being views of the reverted array. When the separation age
+        # is 0, the young part is empty and its convolution is free.
+        sfh_rev = sfh[::-1]
+        sfh_young = sfh_rev[:self.separation_age]
+        sfh_old = sfh_rev[self.separation_age:]
+
+        info_young = 1e6 * np.dot(info[:, :self.separation_age], sfh_young)
+        spec_young = 1e6 * np.dot(spec[:, :self.separation_age], sfh_young)
 
-        info_old = 1e6 * np.dot(info[:, self.separation_age:],
-                                sfh[:-self.separation_age][::-1])
-        spec_old = 1e6 * np.dot(spec[:, self.separation_age:],
-                                sfh[:-self.separation_age][::-1])
+        info_old = 1e6 * np.dot(info[:, self.separation_age:], sfh_old)
+        spec_old = 1e6 * np.dot(spec[:, self.separation_age:], sfh_old)
 
         info_all = info_young + info_old
-        info_all = np.append(info_all, np.average(self.ssp.t[:sfh.size],
-                                                  weights=info[1, :] *
-                                                  sfh[::-1]))
+
+        # The stellar mass-weighted age is the ratio of the convolution of the
+        # age×alive stellar mass product with the SFH to the alive stellar
+        # mass. The product is precomputed so this is just another dot product.
+        age_mass = (1e6 * np.dot(self.t_m_alive[:sfh.size], sfh_rev) /
+                    info_all[1])
+        info_all = np.append(info_all, age_mass)
 
         return spec_young, spec_old, info_young, info_old, info_all
 
@@ -115,9 +130,24 @@ class M2005(SedModule):
             else:
                 raise Exception(f"IMF #{self.imf} unknown")
 
-        self.mask_Q = slice(0, np.searchsorted(self.ssp.wl, 91.2))
-        self.wvl_H = self.ssp.wl[self.mask_Q]
-        self.invhc = 1.0 / (cst.h * cst.c)
+        # Product of the age and the alive stellar mass of the SSP to compute
+        # the stellar mass-weighted age with a single dot product.
+        self.t_m_alive = self.ssp.t * self.ssp.info[1, :]
+
+        # The luminosity, the Lyman continuum luminosity, and the rate of
+        # ionising photons are always integrated on the same wavelength grid.
+        # We precompute the weights of the trapezoidal rule for the three of
+        # them so that they are obtained with a single dot product for each
+        # population. For the rate of ionising photons, the weights include
+        # the λ/hc factor with the conversion of λ from nm to m.
+        wave = self.ssp.wl
+        n_lyc = np.searchsorted(wave, 91.2)
+        wave_lyc = wave[:n_lyc]
+        self.lum_weights = np.zeros((wave.size, 3))
+        self.lum_weights[:, 0] = trapz_weights(wave)
+        self.lum_weights[:n_lyc, 1] = trapz_weights(wave_lyc)
+        self.lum_weights[:n_lyc, 2] = (self.lum_weights[:n_lyc, 1] * wave_lyc *
+                                       1e-9 / (cst.h * cst.c))
 
     def process(self, sed):
         """Add the convolution of a Maraston 2005 SSP to the SED
@@ -130,13 +160,9 @@ class M2005(SedModule):
         """
         out = self.convolve(sed.sfh)
         spec_young, spec_old, info_young, info_old, info_all = out
-        lum_young, lum_old = np.trapz([spec_young, spec_old], self.ssp.wl)
-        lum_ly_young, lum_ly_old = np.trapz(
-            [spec_young[self.mask_Q], spec_old[self.mask_Q]], self.wvl_H
-        )
-        NLy_young, NLy_old = np.trapz([self.wvl_H * spec_young[self.mask_Q],
-                                       self.wvl_H * spec_old[self.mask_Q]],
-                                       x=self.wvl_H) * self.invhc * 1e-9
+        lum_young, lum_ly_young, NLy_young = np.dot(spec_young,
+                                                    self.lum_weights)
+        lum_old, lum_ly_old, NLy_old = np.dot(spec_old, self.lum_weights)
 
         sed.add_module(self.name, self.parameters)
 
@@ -145,43 +171,20 @@ class M2005(SedModule):
         sed.add_info('stellar.old_young_separation_age', self.separation_age,
                      unit='Myr')
 
-        sed.add_info('stellar.mass_total_young', info_young[0], True,
-                     unit='solMass')
-        sed.add_info('stellar.mass_alive_young', info_young[1], True,
-                     unit='solMass')
-        sed.add_info('stellar.mass_white_dwarf_young', info_young[2], True,
-                     unit='solMass')
-        sed.add_info('stellar.mass_neutron_young', info_young[3], True,
-                     unit='solMass')
-        sed.add_info('stellar.mass_black_hole_young', info_young[4], True,
-                     unit='solMass')
+        sed.add_info_many(mass_keys_young, info_young[:5], True,
+                          unit='solMass')
         sed.add_info('stellar.lum_young', lum_young, True, unit='W')
         sed.add_info("stellar.lum_ly_young", lum_ly_young, True, unit='W')
         sed.add_info("stellar.n_ly_young", NLy_young, True,
                      unit='ph/s')
 
-        sed.add_info('stellar.mass_total_old', info_old[0], True,
-                     unit='solMass')
-        sed.add_info('stellar.mass_alive_old', info_old[1], True,
-                     unit='solMass')
-        sed.add_info('stellar.mass_white_dwarf_old', info_old[2], True,
-                     unit='solMass')
-        sed.add_info('stellar.mass_neutron_old', info_old[3], True,
-                     unit='solMass')
-        sed.add_info('stellar.mass_black_hole_old', info_old[4], True,
-                     unit='solMass')
+        sed.add_info_many(mass_keys_old, info_old[:5], True, unit='solMass')
         sed.add_info('stellar.lum_old', lum_old, True, unit='W')
         sed.add_info("stellar.lum_ly_old", lum_ly_old, True, unit='W')
         sed.add_info("stellar.n_ly_old", NLy_old, True,
                      unit='ph/s')
 
-        sed.add_info('stellar.mass_total', info_all[0], True, unit='solMass')
-        sed.add_info('stellar.mass_alive', info_all[1], True, unit='solMass')
-        sed.add_info('stellar.mass_white_dwarf', info_all[2], True,
-                     unit='solMass')
-        sed.add_info('stellar.mass_neutron', info_all[3], True, unit='solMass')
-        sed.add_info('stellar.mass_black_hole', info_all[4], True,
-                     unit='solMass')
+        sed.add_info_many(mass_keys_all, info_all[:5], True, unit='solMass')
         sed.add_info('stellar.age_mass', info_all[5], unit='Myr')
         sed.add_info('stellar.lum', lum_young + lum_old, True, unit='W')
         sed.add_info("stellar.lum_ly", lum_ly_young + lum_ly_old, True,
@@ -182,8 +182,8 @@ class Configuration:
                                 "xray module.")
         # Getting the list of the filters available in pcigale database
         with Database("filters") as db:
-            filter_list = db.parameters["name"]
-        filter_list += [f'line.{line}' for line in default_lines]
+            filter_list = db.parameters["name"] + [f'line.{line}'
+                                                   for line in default_lines]
 
         if self.config['data_file'] != '':
             obs_table = read_table(self.config['data_file'])
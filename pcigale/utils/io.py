@@ -3,9 +3,6 @@ Various utility function for pcigale
 """
 from functools import lru_cache
 
-from astropy.table import Table
-from astropy.io.ascii.core import InconsistentTableError
-
 
 @lru_cache
 def read_table(file_):
@@ -30,6 +27,11 @@ def read_table(file_):
     An error is raised when the table can not be parsed.
 
     """
+    # astropy.table is slow to import and only needed when a table is actually
+    # read, so we import it here rather than when the module is loaded.
+    from astropy.table import Table
+    from astropy.io.ascii.core import InconsistentTableError
+
     try:
         table = Table.read(file_)
     except Exception:  # astropy should raise a specific exception
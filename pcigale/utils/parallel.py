@@ -0,0 +1,17 @@
+"""
+Utility functions to run workers in a pool of processes.
+"""
+
+
+def unpack_worker(args):
+    """Call a worker with its arguments unpacked, imap_unordered providing
+    only one argument.
+
+    Parameters
+    ----------
+    args: tuple
+        Tuple containing the worker and its arguments.
+
+    """
+    worker, *args = args
+    worker(*args)
@@ -62,6 +62,25 @@ class SedWarehouse:
 
         return module
 
+    def preload_modules(self, module_list, parameter_lists):
+        """Instantiate and cache in advance all the modules for the given
+        parameters. This is useful to load the data (e.g. the SSP) only once
+        in a parent process before forking workers, which then share the same
+        memory pages rather than each loading its own copy.
+
+        Parameters
+        ----------
+        module_list: iterable
+            List of module names.
+        parameter_lists: iterable
+            For each module of the module_list, list of the parameter
+            dictionaries for which the module is to be instantiated.
+
+        """
+        for name, parameter_list in zip(module_list, parameter_lists):
+            for parameters in parameter_list:
+                self.get_module_cached(name, **parameters)
+
     def get_sed(self, module_list, parameter_list):
         """Get the SED corresponding to the module and parameter lists
 
@@ -1,3 +1,12 @@
+import os
+# Set environment variables to disable multithreading as users will probably
+# want to set the number of cores to the max of their computer.
+os.environ["OMP_NUM_THREADS"] = "1"
+os.environ["OPENBLAS_NUM_THREADS"] = "1"
+os.environ["MKL_NUM_THREADS"] = "1"
+os.environ["VECLIB_MAXIMUM_THREADS"] = "1"
+os.environ["NUMEXPR_NUM_THREADS"] = "1"
+
 import argparse
 import multiprocessing as mp
 import sys
@@ -14,17 +23,21 @@ from pcigale.data import SimpleDatabase as Database
 def list_filters():
     """Print the list of filters in the pcigale database.
     """
+    # We go through the filters only once, extracting the quantities to
+    # display on the fly rather than keeping all the filters in memory.
+    names, descs, pivots, sizes = [], [], [], []
     with Database("filters") as base:
-        filters = {name: base.get(name=name) for name in
-                   base.parameters["name"]}
-
-    name = Column(data=[filters[f].name for f in filters], name='Name')
-    description = Column(data=[filters[f].desc for f in filters],
-                         name='Description')
-    wl = Column(data=[filters[f].pivot for f in filters],
-                name='Pivot Wavelength', unit=u.nm, format='%d')
-    samples = Column(data=[filters[f].wl.size for f in filters],
-                     name="Points")
+        for filter_name in base.parameters["name"]:
+            _filter = base.get(name=filter_name)
+            names.append(_filter.name)
+            descs.append(_filter.desc)
+            pivots.append(_filter.pivot)
+            sizes.append(_filter.wl.size)
+
+    name = Column(data=names, name='Name')
+    description = Column(data=descs, name='Description')
+    wl = Column(data=pivots, name='Pivot Wavelength', unit=u.nm, format='%d')
+    samples = Column(data=sizes, name="Points")
 
     t = Table()
     t.add_columns([name, description, wl, samples])
@@ -42,7 +55,9 @@ def add_filters(fnames):
             name = f.readline().strip('# \n\t')
             type_ = f.readline().strip('# \n\t')
             desc = f.readline().strip('# \n\t')
-        wl, tr = np.genfromtxt(fname, unpack=True)
+        # np.loadtxt relies on a C parser and is much faster than
+        # np.genfromtxt for these simple two-column files.
+        wl, tr = np.loadtxt(fname, dtype=float, unpack=True)
 
         # We convert the wavelength from Å to nm.
         wl *= 0.1
@@ -74,17 +89,14 @@ def add_filters(fnames):
     db.close()
 
 
-def worker_plot(fname):
+def worker_plot(_filter):
     """Worker to plot filter transmission curves in parallel
 
     Parameters
     ----------
-    fname: string
-        Name of the filter to be plotted
+    _filter: object
+        Filter to be plotted, as retrieved from the database
     """
-    with Database("filters") as db:
-        _filter = db.get(name=fname)
-
     if _filter.pivot >= 1e3 and _filter.pivot < 1e6:
         _filter.wl *= 1e-3
         unit = "μm"
@@ -105,20 +117,24 @@ def worker_plot(fname):
     plt.minorticks_on()
     plt.xlabel(f'Wavelength [{unit}]')
     plt.ylabel('Relative transmission')
-    plt.title(f"{fname} filter")
+    plt.title(f"{_filter.name} filter")
     plt.tight_layout()
-    plt.savefig(f"{fname}.pdf")
+    plt.savefig(f"{_filter.name}.pdf")
 
 
 def plot_filters(fnames):
     """Plot the filters provided as parameters. If not filter is given, then
     plot all the filters.
     """
-    if len(fnames) == 0:
-        with Database("filters") as db:
+    # We retrieve all the filters at once in the parent process so that the
+    # workers only have to do the plotting rather than each opening the
+    # database.
+    with Database("filters") as db:
+        if len(fnames) == 0:
             fnames = db.parameters["name"]
+        filters = [db.get(name=fname) for fname in fnames]
     with mp.Pool(processes=mp.cpu_count()) as pool:
-        pool.map(worker_plot, fnames)
+        pool.map(worker_plot, filters)
 
 
 def main():
@@ -13,9 +13,9 @@ class Plotter(ABC):
     def worker(self):
         pass
 
-    def _parallel_job(self, items, counter):
+    def _parallel_job(self, items, counter, *initargs):
         if self.configuration["cores"] == 1:  # Do not create a new process
-            self.initializer(counter)
+            self.initializer(counter, *initargs)
             for item in items:
                 self.worker(*item)
         else:  # run in parallel
@@ -28,7 +28,7 @@ class Plotter(ABC):
             with mp.Pool(
                 processes=self.configuration["cores"],
                 initializer=self.initializer,
-                initargs=(counter,),
+                initargs=(counter, *initargs),
             ) as pool:
                 pool.starmap(self.worker, items, 1)
 
@@ -43,10 +43,16 @@ class Chi2(Plotter):
         ----------
         :param counter: Counter class object for the number of models plotted
         """
-        global gbl_counter
+        global gbl_counter, gbl_figure, gbl_ax
 
         gbl_counter = counter
 
+        # Each worker draws all its plots on the same figure, which is cleared
+        # between items, rather than creating and destroying a figure for
+        # each of them.
+        gbl_figure = plt.figure()
+        gbl_ax = gbl_figure.add_subplot(111)
+
     @staticmethod
     def worker(obj_name, var_name, format, outdir):
         """Plot the reduced χ² associated with a given analysed variable
@@ -62,15 +68,29 @@ class Chi2(Plotter):
 
         """
         gbl_counter.inc()
-        figure = plt.figure()
-        ax = figure.add_subplot(111)
+        figure = gbl_figure
+        ax = gbl_ax
+        ax.cla()
 
         var_name = var_name.replace("/", "_")
         fnames = outdir.glob(f"{obj_name}_{var_name}_chi2-block-*.npy")
+        # We gather the blocks and plot them all at once as scattering each
+        # block separately builds a new collection every time.
+        chi2 = []
+        model_variable = []
         for fname in fnames:
-            data = np.memmap(fname, dtype=np.float64)
-            data = np.memmap(fname, dtype=np.float64, shape=(2, data.size // 2))
-            ax.scatter(data[1, :], data[0, :], color="k", s=0.1)
+            # The blocks are copied anyway when concatenated, so we read them
+            # directly rather than mapping each file twice to get its shape.
+            data = np.fromfile(fname, dtype=np.float64).reshape(2, -1)
+            chi2.append(data[0, :])
+            model_variable.append(data[1, :])
+        if len(chi2) > 0:
+            ax.scatter(
+                np.concatenate(model_variable),
+                np.concatenate(chi2),
+                color="k",
+                s=0.1,
+            )
         ax.set_xlabel(var_name)
         ax.set_ylabel(r"Reduced $\chi^2$")
         ax.set_ylim(
@@ -81,4 +101,3 @@ class Chi2(Plotter):
             f"Reduced $\chi^2$ distribution of {var_name} for " f"{obj_name}."
         )
         figure.savefig(outdir / f"{obj_name}_{var_name}_chi2.{format}")
-        plt.close(figure)
@@ -7,7 +7,6 @@ import matplotlib.pyplot as plt
 import multiprocessing as mp
 import numpy as np
 import pkg_resources
-from scipy import stats
 
 from pcigale.utils.console import console, INFO
 from pcigale.utils.counter import Counter
@@ -57,7 +56,6 @@ class Mock(Plotter):
                 exact[f"best.{param}"],
                 estimated[f"bayes.{param}"],
                 param,
-                logo,
                 outdir,
             )
             for param in params
@@ -65,7 +63,9 @@ class Mock(Plotter):
 
         counter = Counter(len(arguments), 1, "Parameter")
 
-        self._parallel_job(arguments, counter)
+        # The logo is the same for all the plots so it is sent only once to
+        # each worker through the initializer rather than with every item.
+        self._parallel_job(arguments, counter, logo)
 
         # Print the final value as it may not otherwise be printed
         counter.global_counter.value = len(arguments)
@@ -73,18 +73,28 @@ class Mock(Plotter):
         console.print(f"{INFO} Done.")
 
     @staticmethod
-    def initializer(counter):
+    def initializer(counter, logo):
         """Initializer of the pool of processes to share variables between workers.
         Parameters
         ----------
         :param counter: Counter class object for the number of models plotted
+        :param logo: Image of the logo or False not to add it to the plots
         """
-        global gbl_counter
+        global gbl_counter, gbl_figure, gbl_ax
 
         gbl_counter = counter
 
+        # Each worker draws all its plots on the same figure, which is cleared
+        # between items, rather than creating and destroying a figure for
+        # each of them. As the logo is drawn on the figure rather than on the
+        # axes, it is added once and for all.
+        gbl_figure = plt.figure()
+        gbl_ax = gbl_figure.add_subplot(111)
+        if logo is not False:
+            gbl_figure.figimage(logo, 0, 0, origin="upper", zorder=0, alpha=1)
+
     @staticmethod
-    def worker(exact, estimated, param, logo, outdir):
+    def worker(exact, estimated, param, outdir):
         """Plot the exact and estimated values of a parameter for the mock analysis
 
         Parameters
@@ -95,8 +105,6 @@ class Mock(Plotter):
             Estimated values of the parameter.
         param: string
             Name of the parameter
-        nologo: boolean
-            Do not add the logo when set to true.
         outdir: Path
             Path to outdir
 
@@ -104,17 +112,29 @@ class Mock(Plotter):
         gbl_counter.inc()
         range_exact = np.linspace(np.min(exact), np.max(exact), 100)
 
-        # We compute the linear regression
+        # We compute the linear regression. Only the slope, the intercept, and
+        # the correlation coefficient are needed, so we compute them directly
+        # rather than relying on scipy.stats.linregress, which also computes
+        # the p-value and the standard error.
         if np.min(exact) < np.max(exact):
-            slope, intercept, r_value, p_value, std_err = stats.linregress(
-                exact, estimated
-            )
+            x = np.asarray(exact, dtype=float)
+            y = np.asarray(estimated, dtype=float)
+            dx = x - x.mean()
+            dy = y - y.mean()
+            ssx = dx @ dx
+            ssy = dy @ dy
+            sxy = dx @ dy
+            slope = sxy / ssx
+            intercept = y.mean() - slope * x.mean()
+            r_value = sxy / np.sqrt(ssx * ssy) if ssy > 0.0 else 0.0
         else:
             slope = 0.0
             intercept = 1.0
             r_value = 0.0
-        figure = plt.figure()
-        plt.errorbar(
+        figure = gbl_figure
+        ax = gbl_ax
+        ax.cla()
+        ax.errorbar(
             exact,
             estimated,
             marker=".",
@@ -123,23 +143,18 @@ class Mock(Plotter):
             linestyle="None",
             capsize=0.0,
         )
-        plt.plot(range_exact, range_exact, color="r", label="1-to-1")
-        plt.plot(
+        ax.plot(range_exact, range_exact, color="r", label="1-to-1")
+        ax.plot(
             range_exact,
             slope * range_exact + intercept,
             color="b",
             label=f"exact-fit $r^2$ = {r_value**2:.2f}",
         )
-        plt.xlabel("Exact")
-        plt.ylabel("Estimated")
-        plt.title(param)
-        plt.legend(loc="best", fancybox=True, framealpha=0.5, numpoints=1)
-        plt.minorticks_on()
-
-        if logo is not False:
-            figure.figimage(logo, 0, 0, origin="upper", zorder=0, alpha=1)
-
-        plt.tight_layout()
-        plt.savefig(outdir / f"mock_{param}.pdf", dpi=figure.dpi * 2.0)
-
-        plt.close()
+        ax.set_xlabel("Exact")
+        ax.set_ylabel("Estimated")
+        ax.set_title(param)
+        ax.legend(loc="best", fancybox=True, framealpha=0.5, numpoints=1)
+        ax.minorticks_on()
+
+        figure.tight_layout()
+        figure.savefig(outdir / f"mock_{param}.pdf", dpi=figure.dpi * 2.0)
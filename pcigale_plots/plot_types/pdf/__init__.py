@@ -42,10 +42,16 @@ class PDF(Plotter):
         ----------
         :param counter: Counter class object for the number of models plotted
         """
-        global gbl_counter
+        global gbl_counter, gbl_figure, gbl_ax
 
         gbl_counter = counter
 
+        # Each worker draws all its plots on the same figure, which is cleared
+        # between items, rather than creating and destroying a figure for
+        # each of them.
+        gbl_figure = plt.figure()
+        gbl_ax = gbl_figure.add_subplot(111)
+
     @staticmethod
     def worker(obj_name, var_name, format, outdir):
         """Plot the PDF associated with a given analysed variable
@@ -66,8 +72,9 @@ class PDF(Plotter):
         likelihood = []
         model_variable = []
         for fname in fnames:
-            data = np.memmap(fname, dtype=np.float64)
-            data = np.memmap(fname, dtype=np.float64, shape=(2, data.size // 2))
+            # The blocks are copied anyway when concatenated, so we read them
+            # directly rather than mapping each file twice to get its shape.
+            data = np.fromfile(fname, dtype=np.float64).reshape(2, -1)
 
             likelihood.append(np.exp(-data[0, :] / 2.0))
             model_variable.append(data[1, :])
@@ -99,8 +106,9 @@ class PDF(Plotter):
                 pdf_grid = np.linspace(min_hist, max_hist, Npdf)
                 pdf_prob = np.interp(pdf_grid, pdf_x, pdf_prob)
 
-            figure = plt.figure()
-            ax = figure.add_subplot(111)
+            figure = gbl_figure
+            ax = gbl_ax
+            ax.cla()
             ax.plot(pdf_grid, pdf_prob, color="k")
             ax.set_xlabel(var_name)
             ax.set_ylabel("Probability density")
@@ -110,7 +118,6 @@ class PDF(Plotter):
                 f"{obj_name}"
             )
             figure.savefig(outdir / f"{obj_name}_{var_name}_pdf.{format}")
-            plt.close(figure)
         else:
             console.print(
                 f"{WARNING} Cannot build the PDF of {var_name} for "